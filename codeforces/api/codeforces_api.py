@@ -2,16 +2,74 @@
 This file provides api for retrieving data from codeforces.com
 """
 
+import asyncio
+import atexit
+import gzip
 import hashlib
-import json
 import operator
 import random
+import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import chain
 from urllib.error import HTTPError
-from urllib.request import urlopen
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson.backends.yajl2_cffi as ijson
+    except ImportError:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
 
+from ..utils import TtlCache
 from .json_objects import Contest
 from .json_objects import Hack
 from .json_objects import Problem
@@ -25,16 +83,170 @@ from .json_objects import User
 __all__ = ['CodeforcesAPI', 'CodeforcesLanguage']
 
 
+_LIST_ENDPOINTS = {
+    'contest.hacks': Hack,
+    'contest.list': Contest,
+    'contest.ratingChanges': RatingChange,
+    'contest.status': Submission,
+    'problemset.recentStatus': Submission,
+    'user.info': User,
+    'user.ratedList': User,
+    'user.rating': RatingChange,
+    'user.status': Submission
+}
+
+
 class CodeforcesLanguage(Enum):
     en = 'en'
     ru = 'ru'
 
 
+_BASE_URLS = {
+    CodeforcesLanguage.en: 'https://codeforces.com/api/',
+    CodeforcesLanguage.ru: 'https://codeforces.ru/api/'
+}
+
+_language_cache = {
+    'en': CodeforcesLanguage.en,
+    'ru': CodeforcesLanguage.ru,
+    CodeforcesLanguage.en: CodeforcesLanguage.en,
+    CodeforcesLanguage.ru: CodeforcesLanguage.ru
+}
+
+
+_aiohttp_sessions = {}
+_aiohttp_atexit_registered = False
+
+
+_simdjson_parser = simdjson.Parser() if simdjson is not None else None
+_simdjson_lock = threading.Lock()
+
+
+def _materialize(value):
+    """
+    Converts a simdjson proxy into plain Python objects.
+
+    The shared parser's buffers are reused by the next parse, so proxies
+    must not escape __check_json
+
+    :param value: simdjson proxy or plain value
+    :return: Plain Python value
+    """
+    if hasattr(value, 'as_list'):
+        return value.as_list()
+
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+
+    return value
+
+
+def _to_table(records):
+    """
+    Builds a columnar table from a list of dicts.
+
+    Prefers pyarrow.Table, falling back to pandas.DataFrame. One of the
+    optional pyarrow or pandas packages is required
+
+    :param records: Parsed result items
+    :type records: list of dict
+    :return: Columnar table
+    :rtype: pyarrow.Table or pandas.DataFrame
+    """
+    if pyarrow is not None:
+        return pyarrow.Table.from_pylist(records)
+
+    if pandas is not None:
+        return pandas.DataFrame.from_records(records)
+
+    raise RuntimeError('pyarrow or pandas is required for table results')
+
+
+def _accept_encoding():
+    """
+    Returns the Accept-Encoding header value.
+
+    Brotli is advertised only when the optional brotli package is installed
+    """
+    return 'gzip, br' if brotli is not None else 'gzip'
+
+
+def _decompress_body(body, encoding):
+    """
+    Decompresses response body according to its Content-Encoding
+
+    :param body: Raw response body
+    :type body: bytes
+    :param encoding: Value of the Content-Encoding header
+    :return: Decompressed body
+    :rtype: bytes
+    """
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+
+    if encoding == 'br' and brotli is not None:
+        return brotli.decompress(body)
+
+    return body
+
+
+def _get_aiohttp_session():
+    """
+    Returns the aiohttp session of the running event loop, creating it on
+    first use.
+
+    Sessions are keyed by loop because a session cannot be used after the
+    loop it was created on is closed — each asyncio.run gets a fresh one.
+    Within one loop the session is reused across requests, so TCP
+    handshakes are amortized. Leftover sessions are closed at interpreter
+    exit.
+
+    :rtype: aiohttp.ClientSession
+    """
+    global _aiohttp_atexit_registered
+
+    if aiohttp is None:
+        raise RuntimeError('aiohttp is required for asynchronous requests')
+
+    loop = asyncio.get_running_loop()
+    session = _aiohttp_sessions.get(loop)
+
+    if session is None or session.closed:
+        session = aiohttp.ClientSession()
+        _aiohttp_sessions[loop] = session
+
+        if not _aiohttp_atexit_registered:
+            atexit.register(_close_aiohttp_sessions)
+            _aiohttp_atexit_registered = True
+
+    return session
+
+
+def _close_aiohttp_sessions():
+    """
+    Closes any aiohttp sessions still open at interpreter exit
+    """
+    while _aiohttp_sessions:
+        loop, session = _aiohttp_sessions.popitem()
+
+        if session.closed:
+            continue
+
+        try:
+            if loop.is_closed():
+                asyncio.run(session.close())
+            else:
+                loop.run_until_complete(session.close())
+        except RuntimeError:
+            pass
+
+
 class CodeforcesDataRetriever:
     """
     This class hides low-level operations with retrieving data from Codeforces site
     """
-    def __init__(self, lang=CodeforcesLanguage.en, key=None, secret=None):
+    def __init__(self, lang=CodeforcesLanguage.en, key=None, secret=None, pool_connections=10,
+                 cache_ttl=60, cache_maxsize=512, cache_ttl_overrides=None):
         """
         :param lang: Language
         :type lang: CodeforcesLanguage
@@ -44,6 +256,21 @@ class CodeforcesDataRetriever:
 
         :param secret: Private API secret. Ignored if key is None
         :type secret: str
+
+        :param pool_connections: Maximum number of connections kept alive in the pool.
+                                 Used only when the optional urllib3 package is installed
+        :type pool_connections: int
+
+        :param cache_ttl: Default time-to-live of a cached answer, in seconds.
+                          None disables caching
+        :type cache_ttl: int or float or None
+
+        :param cache_maxsize: Maximum number of cached answers
+        :type cache_maxsize: int
+
+        :param cache_ttl_overrides: Per-method time-to-live overrides,
+                                    e.g. {'problemset.problems': 3600}
+        :type cache_ttl_overrides: dict of [str, int or float]
         """
         self._key = None
         self._secret = None
@@ -52,33 +279,221 @@ class CodeforcesDataRetriever:
             self.key = key
             self.secret = secret
 
-        self._base_from_language = {
-            CodeforcesLanguage.en: 'http://codeforces.com/api/',
-            CodeforcesLanguage.ru: 'http://codeforces.ru/api/'
-        }
+        self.language = lang
+
+        if urllib3 is not None:
+            self._pool = urllib3.PoolManager(maxsize=pool_connections,
+                                             block=False,
+                                             retries=urllib3.Retry(total=3, backoff_factor=0.2))
+        else:
+            self._pool = None
+
+        if httpx is not None:
+            limits = httpx.Limits(max_connections=2 * pool_connections,
+                                  max_keepalive_connections=pool_connections)
 
-        self._language = lang
+            try:
+                self._client = httpx.Client(http2=True, timeout=30, limits=limits)
+            except ImportError:
+                self._client = httpx.Client(timeout=30, limits=limits)
+        else:
+            self._client = None
+
+        if cache_ttl is not None:
+            self._cache = TtlCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        else:
+            self._cache = None
+
+        self._cache_ttl_overrides = dict(cache_ttl_overrides) if cache_ttl_overrides else {}
+
+    def __del__(self):
+        if getattr(self, '_pool', None) is not None:
+            self._pool.clear()
+
+        if getattr(self, '_client', None) is not None:
+            self._client.close()
 
     def get_data(self, method, **kwargs):
         """
         Retrieves data by given method with given parameters
 
+        Answers are cached for a short time (see cache_ttl), so repeated
+        calls with the same parameters skip the network round-trip
+
         :param method: Request method
         :param kwargs: HTTP parameters
         :return:
         """
-        return self.__get_data(self.__generate_url(method, **kwargs))
+        url = self.__generate_url(method, **kwargs)
+
+        if self._cache is None:
+            return self.__get_data(url)
+
+        data = self._cache.get(url)
+
+        if data is None:
+            data = self.__get_data(url)
+            self._cache.put(url, data, ttl=self._cache_ttl_overrides.get(method))
+
+        return data
+
+    def invalidate(self, method=None):
+        """
+        Drops cached answers.
+
+        :param method: Request method whose answers should be dropped,
+                       or None to drop everything
+        :type method: str or None
+        """
+        if self._cache is None:
+            return
+
+        if method is None:
+            self._cache.clear()
+        else:
+            prefix = self.base + method
+            self._cache.remove_if(lambda url: url.startswith(prefix))
+
+    def stream_data(self, method, result_path='result.item', **kwargs):
+        """
+        Retrieves data by given method, yielding result items one at a time.
+
+        When the optional ijson package is installed and response caching is
+        disabled (cache_ttl=None), the response body is parsed
+        incrementally, so large answers (user.ratedList, contest.status,
+        ...) never have to be materialized as a whole JSON tree in memory.
+        Otherwise this delegates to the buffered :meth:`get_data` path — a
+        cached answer has to be materialized anyway, so caching and
+        streaming are mutually exclusive. The request is issued and failed
+        answers are raised eagerly in all cases; only the body parsing is
+        lazy.
+
+        :param method: Request method
+        :param result_path: ijson path of the items inside the response
+        :param kwargs: HTTP parameters
+        :return: Iterator over raw result items
+        :exception ValueError: raised when the API reports a failed request
+        """
+        if ijson is None or self._cache is not None:
+            return iter(self.get_data(method, **kwargs))
+
+        url = self.__generate_url(method, **kwargs)
+
+        if self._pool is not None:
+            return self.__stream_from_pool(url, result_path)
+
+        return self.__stream_from_urlopen(url, result_path)
+
+    def __stream_from_pool(self, url, result_path):
+        """
+        Streams result items from given url through the urllib3 pool.
+
+        urllib3 does not raise on error statuses, so non-200 answers are
+        read in full and routed through the envelope check, which raises
+        ValueError with the API comment instead of yielding nothing
+        """
+        response = self._pool.request('GET', url,
+                                      headers={'Accept-Encoding': 'gzip'},
+                                      preload_content=False)
+
+        if response.status != 200:
+            try:
+                return iter(self.__check_json(response.data))
+            finally:
+                response.release_conn()
+
+        def generate():
+            consumed = False
+
+            try:
+                yield from ijson.items(response, result_path, use_float=True)
+                consumed = True
+            finally:
+                if consumed:
+                    response.release_conn()
+                else:
+                    response.drain_conn()
+
+        return generate()
+
+    def __stream_from_urlopen(self, url, result_path):
+        """
+        Streams result items from given url through urllib.
+
+        The connection is opened eagerly, so error answers raise here
+        rather than at first iteration
+        """
+        request = Request(url, headers={'Accept-Encoding': 'gzip'})
+
+        try:
+            response = urlopen(request)
+        except HTTPError as http_e:
+            try:
+                data = self.__check_json(_decompress_body(http_e.read(), http_e.headers.get('Content-Encoding')))
+            except Exception as e:
+                raise e from http_e
+
+            return iter(data)
+
+        if response.headers.get('Content-Encoding') in ('gzip', 'x-gzip'):
+            stream = gzip.GzipFile(fileobj=response)
+        else:
+            stream = response
+
+        def generate():
+            with response:
+                yield from ijson.items(stream, result_path, use_float=True)
+
+        return generate()
+
+    async def aget_data(self, method, **kwargs):
+        """
+        Asynchronous version of :meth:`get_data`.
+
+        Requires the optional aiohttp package. Requests issued concurrently
+        (e.g. via asyncio.gather) share one session, so they do not serialize
+        on round-trip time.
+
+        :param method: Request method
+        :param kwargs: HTTP parameters
+        :return:
+        """
+        return await self._aget_data(self.__generate_url(method, **kwargs))
+
+    async def _aget_data(self, url):
+        """
+        Returns data retrieved from given url using the shared aiohttp session
+        """
+        session = _get_aiohttp_session()
+
+        async with session.get(url) as response:
+            return self.__check_json(await response.read())
 
     def __get_data(self, url):
         """
         Returns data retrieved from given url
+
+        Prefers the persistent httpx client when available, which multiplexes
+        concurrent requests over one HTTP/2 connection; then the urllib3
+        connection pool, which amortizes TCP handshakes over consecutive
+        requests. Falls back to urllib otherwise
         """
+        if self._client is not None:
+            return self.__check_json(self._client.get(url).content)
+
+        if self._pool is not None:
+            response = self._pool.request('GET', url, headers={'Accept-Encoding': _accept_encoding()})
+            return self.__check_json(response.data)
+
+        request = Request(url, headers={'Accept-Encoding': _accept_encoding()})
+
         try:
-            with urlopen(url) as req:
-                return self.__check_json(req.read().decode('utf-8'))
+            with urlopen(request) as req:
+                return self.__check_json(_decompress_body(req.read(), req.headers.get('Content-Encoding')))
         except HTTPError as http_e:
             try:
-                return self.__check_json(http_e.read().decode('utf-8'))
+                body = _decompress_body(http_e.read(), http_e.headers.get('Content-Encoding'))
+                return self.__check_json(body)
             except Exception as e:
                 raise e from http_e
 
@@ -99,9 +514,13 @@ class CodeforcesDataRetriever:
             kwargs['apiKey'] = self.key
             kwargs['time'] = int(time.time())
 
-        if kwargs:
-            args = self.__get_valid_args(**kwargs)
-            url += '?' + '&'.join(map(self.__key_value_to_http_parameter, args.items()))
+        if not kwargs:
+            return url
+
+        args = {k: v for k, v in kwargs.items() if v is not None}
+
+        if args:
+            url += '?' + urlencode({k: self.__value_to_http_value(v) for k, v in args.items()}, safe=';')
 
             if self.key is not None and self.secret is not None:
                 url += '&apiSig=' + self.__generate_api_sig(method, args)
@@ -133,13 +552,6 @@ class CodeforcesDataRetriever:
 
         return rand + hashlib.sha512(s.encode()).hexdigest()
 
-    @staticmethod
-    def __get_valid_args(**kwargs):
-        """
-        Filters only not None values
-        """
-        return {k: v for k, v in kwargs.items() if v is not None}
-
     @staticmethod
     def __key_value_to_http_parameter(key_value):
         """
@@ -147,23 +559,49 @@ class CodeforcesDataRetriever:
         """
         key, value = key_value
 
+        return '{0}={1}'.format(key, CodeforcesDataRetriever.__value_to_http_value(value))
+
+    @staticmethod
+    def __value_to_http_value(value):
+        """
+        Transforms value to its http parameter representation.
+
+        Lists are sorted and joined with ';' as the API expects
+        """
         if isinstance(value, list):
-            value = ';'.join(sorted(map(str, value)))
-        else:
-            value = str(value)
+            return ';'.join(sorted(map(str, value)))
 
-        return '{0}={1}'.format(key, value)
+        return str(value)
 
     @staticmethod
     def __check_json(answer):
         """
         Check if answer is correct according to http://codeforces.com/api/help
+
+        Accepts raw response bytes, so no intermediate str copy is made.
+        When the optional pysimdjson package is installed the envelope is
+        parsed with a reused SIMD-accelerated parser and only the result
+        subtree is converted to Python objects
+        """
+        if _simdjson_parser is not None and isinstance(answer, bytes):
+            # the shared parser is not thread-safe and reparsing invalidates
+            # live proxies, so parse and materialize under one lock
+            with _simdjson_lock:
+                return CodeforcesDataRetriever.__check_values(_simdjson_parser.parse(answer))
+
+        return CodeforcesDataRetriever.__check_values(_json.loads(answer))
+
+    @staticmethod
+    def __check_values(values):
         """
-        values = json.loads(answer)
+        Extracts the result from a parsed answer envelope
 
+        :exception ValueError: raised when the answer reports a failure or
+                               misses a required field
+        """
         try:
             if values['status'] == 'OK':
-                return values['result']
+                return _materialize(values['result'])
             else:
                 raise ValueError(values['comment'])
         except KeyError as e:
@@ -172,10 +610,11 @@ class CodeforcesDataRetriever:
     @property
     def base(self):
         """
-        :return: Base of url according to language
+        :return: Base of url according to language. Precomputed when the
+                 language is set, so no lookup is done per request
         :rtype: str
         """
-        return self._base_from_language[self.language]
+        return self._base_url
 
     @property
     def language(self):
@@ -192,7 +631,8 @@ class CodeforcesDataRetriever:
         :type value: CodeforcesLanguage or str
         """
         assert isinstance(value, (CodeforcesLanguage, str))
-        self._language = CodeforcesLanguage(value)
+        self._language = _language_cache.get(value) or CodeforcesLanguage(value)
+        self._base_url = _BASE_URLS[self._language]
 
     @property
     def key(self):
@@ -242,7 +682,8 @@ class CodeforcesAPI:
     This class provides api for retrieving data from codeforces.com
     """
 
-    def __init__(self, lang='en', key=None, secret=None):
+    def __init__(self, lang='en', key=None, secret=None, pool_connections=10,
+                 cache_ttl=60, cache_maxsize=512, cache_ttl_overrides=None):
         """
         :param lang: Language
         :type lang: str or CodeforcesLanguage
@@ -252,8 +693,87 @@ class CodeforcesAPI:
 
         :param secret: Private API secret. Ignored if key is None
         :type secret: str
+
+        :param pool_connections: Maximum number of connections kept alive in the pool.
+                                 Used only when the optional urllib3 package is installed
+        :type pool_connections: int
+
+        :param cache_ttl: Default time-to-live of a cached answer, in seconds.
+                          None disables caching
+        :type cache_ttl: int or float or None
+
+        :param cache_maxsize: Maximum number of cached answers
+        :type cache_maxsize: int
+
+        :param cache_ttl_overrides: Per-method time-to-live overrides,
+                                    e.g. {'problemset.problems': 3600}
+        :type cache_ttl_overrides: dict of [str, int or float]
+        """
+        self._data_retriever = CodeforcesDataRetriever(lang, key, secret,
+                                                       pool_connections=pool_connections,
+                                                       cache_ttl=cache_ttl,
+                                                       cache_maxsize=cache_maxsize,
+                                                       cache_ttl_overrides=cache_ttl_overrides)
+
+    def gather(self, *calls):
+        """
+        Runs given zero-argument callables concurrently and returns their results.
+
+        Lets synchronous code overlap several network-bound calls without
+        restructuring around asyncio, e.g.
+
+            hacks, standings = api.gather(lambda: list(api.contest_hacks(374)),
+                                          lambda: api.contest_standings(374))
+
+        The interpreter lock is released around socket I/O, so the calls
+        genuinely overlap. Note that the list-returning methods are lazy:
+        wrap them in list(...) inside the callable so the fetch itself runs
+        in the worker thread.
+
+        :param calls: Callables taking no arguments
+        :return: List with the result of each callable, in the order given
+        :rtype: list
+        """
+        assert all(callable(call) for call in calls)
+
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(16, len(calls))) as executor:
+            return list(executor.map(lambda call: call(), calls))
+
+    def __fetch_list(self, method, **params):
+        """
+        Retrieves items of given list-returning method, wrapping each item
+        in its typed object according to _LIST_ENDPOINTS.
+
+        Every list endpoint funnels through here, so transport-level
+        optimizations (caching, streaming, compression, parser choice)
+        apply in exactly one place
+
+        :param method: Request method, e.g. 'user.rating'
+        :param params: HTTP parameters
+        :return: Iterator of typed objects
+        """
+        return map(_LIST_ENDPOINTS[method], self._data_retriever.stream_data(method, **params))
+
+    async def __afetch_list(self, method, **params):
+        """
+        Asynchronous version of :meth:`__fetch_list`
         """
-        self._data_retriever = CodeforcesDataRetriever(CodeforcesLanguage(lang), key, secret)
+        data = await self._data_retriever.aget_data(method, **params)
+
+        return map(_LIST_ENDPOINTS[method], data)
+
+    def invalidate(self, method=None):
+        """
+        Drops cached answers.
+
+        :param method: Request method whose answers should be dropped,
+                       e.g. 'contest.list', or None to drop everything
+        :type method: str or None
+        """
+        self._data_retriever.invalidate(method)
 
     def contest_hacks(self, contest_id):
         """
@@ -270,9 +790,17 @@ class CodeforcesAPI:
         """
         assert isinstance(contest_id, int)
 
-        data = self._data_retriever.get_data('contest.hacks', contestId=contest_id)
+        return self.__fetch_list('contest.hacks', contestId=contest_id)
+
+    async def acontest_hacks(self, contest_id):
+        """
+        Asynchronous version of :meth:`contest_hacks`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(contest_id, int)
 
-        return map(Hack, data)
+        return await self.__afetch_list('contest.hacks', contestId=contest_id)
 
     def contest_list(self, gym=False):
         """
@@ -285,9 +813,15 @@ class CodeforcesAPI:
                  including mashups and private gyms.
         :rtype: iterator of Contest
         """
-        data = self._data_retriever.get_data('contest.list', gym=gym)
+        return self.__fetch_list('contest.list', gym=gym)
 
-        return map(Contest, data)
+    async def acontest_list(self, gym=False):
+        """
+        Asynchronous version of :meth:`contest_list`.
+
+        Requires the optional aiohttp package.
+        """
+        return await self.__afetch_list('contest.list', gym=gym)
 
     def contest_rating_changes(self, contest_id):
         """
@@ -297,9 +831,15 @@ class CodeforcesAPI:
         :return: Returns an iterator of RatingChange objects.
         :rtype: iterator of RatingChange
         """
-        data = self._data_retriever.get_data('contest.ratingChanges', contestId=contest_id)
+        return self.__fetch_list('contest.ratingChanges', contestId=contest_id)
 
-        return map(RatingChange, data)
+    async def acontest_rating_changes(self, contest_id):
+        """
+        Asynchronous version of :meth:`contest_rating_changes`.
+
+        Requires the optional aiohttp package.
+        """
+        return await self.__afetch_list('contest.ratingChanges', contestId=contest_id)
 
     def contest_standings(self, contest_id, from_=1, count=None, handles=None, show_unofficial=False):
         """
@@ -350,6 +890,32 @@ class CodeforcesAPI:
                 'problems': map(Problem, data['problems']),
                 'rows': map(RanklistRow, data['rows'])}
 
+    async def acontest_standings(self, contest_id, from_=1, count=None, handles=None, show_unofficial=False):
+        """
+        Asynchronous version of :meth:`contest_standings`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(contest_id, int), 'contest_id should be of type int, not {}'.format(type(contest_id))
+        assert isinstance(from_, int), 'from_ should be of type int, not {}'.format(type(from_))
+        assert isinstance(count, int) or count is None, 'count should be of type int, not {}'.format(type(count))
+        assert isinstance(handles, list) or handles is None, \
+            'handles should be of type list of str, not {}'.format(type(handles))
+        assert handles is None or len(handles) <= 10000, 'No more than 10000 handles is accepted'
+        assert isinstance(show_unofficial, bool), \
+            'show_unofficial should be of type bool, not {}'.format(type(show_unofficial))
+
+        data = await self._data_retriever.aget_data('contest.standings',
+                                                    contestId=contest_id,
+                                                    count=count,
+                                                    handles=handles,
+                                                    showUnofficial=show_unofficial,
+                                                    **{'from': from_})
+
+        return {'contest': Contest(data['contest']),
+                'problems': map(Problem, data['problems']),
+                'rows': map(RanklistRow, data['rows'])}
+
     def contest_status(self, contest_id, handle=None, from_=1, count=None):
         """
         Returns submissions for specified contest.
@@ -377,13 +943,66 @@ class CodeforcesAPI:
         assert isinstance(from_, int)
         assert isinstance(count, int) or count is None
 
+        return self.__fetch_list('contest.status',
+                                 contestId=contest_id,
+                                 handle=handle,
+                                 count=count,
+                                 **{'from': from_})
+
+    def contest_status_table(self, contest_id, handle=None, from_=1, count=None):
+        """
+        Returns submissions for specified contest as a columnar table.
+
+        Unlike :meth:`contest_status`, no Submission objects are built — see
+        :meth:`user_rated_list_table` for the rationale.
+
+        Requires the optional pyarrow or pandas package.
+
+        :param contest_id: Id of the contest.
+                           It is not the round number. It can be seen in contest URL. For example: /contest/374/status
+        :type contest_id: int
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param from_: 1-based index of the first submission to return.
+        :type from_: int
+
+        :param count: Number of returned submissions.
+        :type count: int
+
+        :return: Table with one row per submission, sorted in decreasing order of submission id.
+        :rtype: pyarrow.Table or pandas.DataFrame
+        """
+        assert isinstance(contest_id, int)
+        assert isinstance(handle, str) or handle is None
+        assert isinstance(from_, int)
+        assert isinstance(count, int) or count is None
+
         data = self._data_retriever.get_data('contest.status',
                                              contestId=contest_id,
                                              handle=handle,
                                              count=count,
                                              **{'from': from_})
 
-        return map(Submission, data)
+        return _to_table(data)
+
+    async def acontest_status(self, contest_id, handle=None, from_=1, count=None):
+        """
+        Asynchronous version of :meth:`contest_status`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(contest_id, int)
+        assert isinstance(handle, str) or handle is None
+        assert isinstance(from_, int)
+        assert isinstance(count, int) or count is None
+
+        return await self.__afetch_list('contest.status',
+                                        contestId=contest_id,
+                                        handle=handle,
+                                        count=count,
+                                        **{'from': from_})
 
     def problemset_problems(self, tags=None):
         """
@@ -400,6 +1019,17 @@ class CodeforcesAPI:
         return {'problems': map(Problem, data['problems']),
                 'problemStatistics': map(ProblemStatistics, data['problemStatistics'])}
 
+    async def aproblemset_problems(self, tags=None):
+        """
+        Asynchronous version of :meth:`problemset_problems`.
+
+        Requires the optional aiohttp package.
+        """
+        data = await self._data_retriever.aget_data('problemset.problems', tags=tags)
+
+        return {'problems': map(Problem, data['problems']),
+                'problemStatistics': map(ProblemStatistics, data['problemStatistics'])}
+
     def problemset_recent_status(self, count):
         """
         Returns recent submissions.
@@ -413,24 +1043,57 @@ class CodeforcesAPI:
         assert isinstance(count, int)
         assert 0 < count <= 1000
 
-        data = self._data_retriever.get_data('problemset.recentStatus', count=count)
+        return self.__fetch_list('problemset.recentStatus', count=count)
 
-        return map(Submission, data)
+    async def aproblemset_recent_status(self, count):
+        """
+        Asynchronous version of :meth:`problemset_recent_status`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(count, int)
+        assert 0 < count <= 1000
+
+        return await self.__afetch_list('problemset.recentStatus', count=count)
 
     def user_info(self, handles):
         """
         Returns information about one or several users.
 
-        :param handles: List of handles. No more than 10000 handles is accepted.
+        :param handles: List of handles. Lists longer than 10000 handles (the API cap)
+                        are chunked and requested automatically.
         :type handles: list of str
         :return: Returns an iterator of User objects for requested handles.
         :rtype: iterator of User
         """
         assert isinstance(handles, list)
 
-        data = self._data_retriever.get_data('user.info', handles=handles)
+        if len(handles) > 10000:
+            chunks = (handles[i:i + 10000] for i in range(0, len(handles), 10000))
+            return chain.from_iterable(self.__fetch_list('user.info', handles=chunk) for chunk in chunks)
+
+        return self.__fetch_list('user.info', handles=handles)
+
+    async def auser_info(self, handles):
+        """
+        Asynchronous version of :meth:`user_info`.
+
+        Lists longer than 10000 handles (the API cap) are chunked and the
+        shards are requested concurrently, so they overlap in one
+        round-trip window.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(handles, list)
+
+        if len(handles) > 10000:
+            chunks = [handles[i:i + 10000] for i in range(0, len(handles), 10000)]
+            results = await asyncio.gather(*[self._data_retriever.aget_data('user.info', handles=chunk)
+                                             for chunk in chunks])
 
-        return map(User, data)
+            return map(User, chain.from_iterable(results))
+
+        return await self.__afetch_list('user.info', handles=handles)
 
     def user_rated_list(self, active_only=False):
         """
@@ -444,9 +1107,38 @@ class CodeforcesAPI:
         """
         assert isinstance(active_only, bool)
 
-        data = self._data_retriever.get_data('user.ratedList', activeOnly=active_only)
+        return self.__fetch_list('user.ratedList', activeOnly=active_only)
+
+    async def auser_rated_list(self, active_only=False):
+        """
+        Asynchronous version of :meth:`user_rated_list`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(active_only, bool)
+
+        return await self.__afetch_list('user.ratedList', activeOnly=active_only)
+
+    def user_rated_list_table(self, active_only=False):
+        """
+        Returns the list of all rated users as a columnar table.
+
+        Unlike :meth:`user_rated_list`, no User objects are built: the parsed
+        records are handed to pyarrow (or pandas) in a single pass, so
+        analytic workloads can scan whole columns instead of iterating
+        hundreds of thousands of Python objects.
+
+        Requires the optional pyarrow or pandas package.
 
-        return map(User, data)
+        :param active_only: If true then only users, who participated in rated contest during the last month are
+                            returned. Otherwise, all users with at least one rated contest are returned.
+        :type active_only: bool
+        :return: Table with one row per user, sorted in decreasing order of rating.
+        :rtype: pyarrow.Table or pandas.DataFrame
+        """
+        assert isinstance(active_only, bool)
+
+        return _to_table(self._data_retriever.get_data('user.ratedList', activeOnly=active_only))
 
     def user_rating(self, handle):
         """
@@ -460,9 +1152,17 @@ class CodeforcesAPI:
         """
         assert isinstance(handle, str), 'Handle should have str type, not {}'.format(type(handle))
 
-        data = self._data_retriever.get_data('user.rating', handle=handle)
+        return self.__fetch_list('user.rating', handle=handle)
+
+    async def auser_rating(self, handle):
+        """
+        Asynchronous version of :meth:`user_rating`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(handle, str), 'Handle should have str type, not {}'.format(type(handle))
 
-        return map(RatingChange, data)
+        return await self.__afetch_list('user.rating', handle=handle)
 
     def user_status(self, handle, from_=1, count=None):
         """
@@ -481,6 +1181,16 @@ class CodeforcesAPI:
         assert isinstance(from_, int)
         assert isinstance(count, int) or count is None
 
-        data = self._data_retriever.get_data('user.status', handle=handle, count=count, **{'from': from_})
+        return self.__fetch_list('user.status', handle=handle, count=count, **{'from': from_})
+
+    async def auser_status(self, handle, from_=1, count=None):
+        """
+        Asynchronous version of :meth:`user_status`.
+
+        Requires the optional aiohttp package.
+        """
+        assert isinstance(handle, str)
+        assert isinstance(from_, int)
+        assert isinstance(count, int) or count is None
 
-        return map(Submission, data)
+        return await self.__afetch_list('user.status', handle=handle, count=count, **{'from': from_})
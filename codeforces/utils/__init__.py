@@ -1 +1,2 @@
-from ..utils.lazy_property import *
\ No newline at end of file
+from ..utils.lazy_property import *
+from ..utils.ttl_cache import *
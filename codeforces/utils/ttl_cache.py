@@ -0,0 +1,95 @@
+"""
+This module contains a simple mapping with per-entry time-to-live
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+__all__ = ['TtlCache']
+
+
+class TtlCache:
+    """
+    Maps keys to values, forgetting an entry once its time-to-live expires.
+
+    The oldest entry is evicted when maxsize is reached.
+
+    All operations take an internal lock, so one cache may be shared by
+    several threads
+    """
+
+    def __init__(self, maxsize=512, ttl=60):
+        """
+        :param maxsize: Maximum number of stored entries
+        :type maxsize: int
+
+        :param ttl: Default time-to-live of an entry, in seconds
+        :type ttl: int or float
+        """
+        assert isinstance(maxsize, int) and maxsize > 0
+        assert ttl > 0
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for given key.
+
+        :param key: Key to look up
+        :param default: Value returned when the key is missing or expired
+        :return: Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+
+            if expires_at < time.monotonic():
+                self._entries.pop(key, None)
+                return default
+
+            return value
+
+    def put(self, key, value, ttl=None):
+        """
+        Stores value under given key.
+
+        :param key: Key to store under
+        :param value: Value to store
+        :param ttl: Time-to-live in seconds, or None to use the default one
+        :type ttl: int or float or None
+        """
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._maxsize:
+                self._entries.popitem(last=False)
+
+            self._entries[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), value)
+
+    def remove_if(self, predicate):
+        """
+        Removes all entries whose key matches given predicate.
+
+        :param predicate: Callable taking a key and returning bool
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -1,13 +1,51 @@
 """
 This module provides classes for testing User object
 """
+import asyncio
+import io
 import os
 import unittest
 from unittest import mock
 
+from codeforces.api import codeforces_api
 from codeforces.api.codeforces_api import CodeforcesAPI
 
 
+class StubAsyncResponse:
+    """
+    Minimal stand-in for an aiohttp response
+    """
+    def __init__(self, body):
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class StubAsyncSession:
+    """
+    Minimal stand-in for an aiohttp session, recording requested urls
+    """
+    def __init__(self, body):
+        self._body = body
+        self.requested_urls = []
+
+    def get(self, url):
+        self.requested_urls.append(url)
+        return StubAsyncResponse(self._body)
+
+
+# __get_data prefers httpx and urllib3 over urllib when they are importable,
+# so both are patched out — otherwise the tests would bypass the mocked
+# urlopen and issue live requests on machines that have them installed
+@mock.patch('codeforces.api.codeforces_api.httpx', None)
+@mock.patch('codeforces.api.codeforces_api.urllib3', None)
 class CodeforcesAPITests(unittest.TestCase):
     def get_current_directory(self):
         return os.path.dirname(os.path.realpath(__file__))
@@ -29,7 +67,134 @@ class CodeforcesAPITests(unittest.TestCase):
         rating_changes = api.contest_rating_changes(42)
 
         self.assertEqual(9, len(list(rating_changes)))
-        urlopen.assert_called_with('http://codeforces.com/api/contest.ratingChanges?contestId=42')
+
+        request, = urlopen.call_args[0]
+        self.assertEqual('https://codeforces.com/api/contest.ratingChanges?contestId=42', request.full_url)
+        self.assertIn('gzip', request.headers.get('Accept-encoding'))
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_repeated_call_is_cached(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        api = CodeforcesAPI()
+
+        self.assertEqual(9, len(list(api.contest_rating_changes(42))))
+        self.assertEqual(9, len(list(api.contest_rating_changes(42))))
+
+        self.assertEqual(1, urlopen.call_count)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_gather_returns_results_in_order(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        api = CodeforcesAPI()
+
+        first, second = api.gather(lambda: list(api.contest_rating_changes(42)),
+                                   lambda: 'unrelated')
+
+        self.assertEqual(9, len(first))
+        self.assertEqual('unrelated', second)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_user_info_chunks_large_handle_lists(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'user.info.json')
+        api = CodeforcesAPI()
+
+        handles = ['handle{}'.format(i) for i in range(20001)]
+        users = list(api.user_info(handles))
+
+        self.assertEqual(3, urlopen.call_count)
+        self.assertEqual(6, len(users))
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_user_info_small_handle_list_is_single_request(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'user.info.json')
+        api = CodeforcesAPI()
+
+        users = list(api.user_info(['DmitriyH', 'tourist']))
+
+        self.assertEqual(1, urlopen.call_count)
+        self.assertEqual(['DmitriyH', 'tourist'], [user.handle for user in users])
+
+    @unittest.skipUnless(codeforces_api.ijson is not None, 'requires the optional ijson package')
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_streamed_results_match_buffered(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        buffered = list(CodeforcesAPI().contest_rating_changes(42))
+
+        # back the mock with a real stream: ijson probes with read(0) and
+        # prefers readinto(), neither of which a bare return_value handles
+        stream = io.BytesIO(self.load_fixture('contest.ratingChanges.json'))
+        urlopen.return_value.headers.get.return_value = None
+        urlopen.return_value.read.side_effect = stream.read
+        urlopen.return_value.readinto.side_effect = stream.readinto
+        streamed = list(CodeforcesAPI(cache_ttl=None).contest_rating_changes(42))
+
+        self.assertEqual(buffered, streamed)
+
+    @mock.patch('codeforces.api.codeforces_api._get_aiohttp_session')
+    def test_acontest_rating_changes(self, get_session):
+        session = StubAsyncSession(self.load_fixture('contest.ratingChanges.json'))
+        get_session.return_value = session
+        api = CodeforcesAPI()
+
+        rating_changes = list(asyncio.run(api.acontest_rating_changes(42)))
+
+        self.assertEqual(9, len(rating_changes))
+        self.assertEqual(['https://codeforces.com/api/contest.ratingChanges?contestId=42'],
+                         session.requested_urls)
+
+    @mock.patch('codeforces.api.codeforces_api._get_aiohttp_session')
+    def test_async_failed_answer_raises(self, get_session):
+        get_session.return_value = StubAsyncSession(b'{"status": "FAILED", "comment": "Contest not found"}')
+        api = CodeforcesAPI()
+
+        with self.assertRaises(ValueError):
+            asyncio.run(api.acontest_rating_changes(999999))
+
+    @mock.patch('codeforces.api.codeforces_api._get_aiohttp_session')
+    def test_auser_info_chunks_large_handle_lists(self, get_session):
+        session = StubAsyncSession(self.load_fixture('user.info.json'))
+        get_session.return_value = session
+        api = CodeforcesAPI()
+
+        handles = ['handle{}'.format(i) for i in range(20001)]
+        users = list(asyncio.run(api.auser_info(handles)))
+
+        self.assertEqual(3, len(session.requested_urls))
+        self.assertEqual(6, len(users))
+
+    @mock.patch('codeforces.api.codeforces_api.pandas')
+    @mock.patch('codeforces.api.codeforces_api.pyarrow', None)
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_user_rated_list_table_builds_columnar_records(self, urlopen, pandas):
+        self.patch_urlopen_read_method(urlopen, 'user.info.json')
+        api = CodeforcesAPI()
+
+        table = api.user_rated_list_table()
+
+        records, = pandas.DataFrame.from_records.call_args[0]
+        self.assertEqual(['DmitriyH', 'tourist'], [record['handle'] for record in records])
+        self.assertIs(pandas.DataFrame.from_records.return_value, table)
+
+    @mock.patch('codeforces.api.codeforces_api.pandas', None)
+    @mock.patch('codeforces.api.codeforces_api.pyarrow', None)
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_table_methods_require_optional_dependency(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'user.info.json')
+        api = CodeforcesAPI()
+
+        with self.assertRaises(RuntimeError):
+            api.user_rated_list_table()
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_invalidate_drops_cached_answer(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        api = CodeforcesAPI()
+
+        self.assertEqual(9, len(list(api.contest_rating_changes(42))))
+        api.invalidate('contest.ratingChanges')
+        self.assertEqual(9, len(list(api.contest_rating_changes(42))))
+
+        self.assertEqual(2, urlopen.call_count)
 
 
 if __name__ == '__main__':